@@ -61,6 +61,16 @@ game_window = pygame.display.set_mode((window_width, window_height))
 # FPS controller
 fps = pygame.time.Clock()
 
+# Cache of loaded fonts so SysFont lookups only happen once per size/style
+font_cache = {}
+
+def get_font(size, bold=False):
+    """Return a cached Courier New font of the given size"""
+    key = (size, bold)
+    if key not in font_cache:
+        font_cache[key] = pygame.font.SysFont('Courier New', size, bold=bold)
+    return font_cache[key]
+
 # CSV file for storing member information
 CSV_FILE = "member_info.csv"
 
@@ -69,6 +79,7 @@ class MemberDatabase:
     
     def __init__(self):
         self.members = {}  # Dictionary to store member info
+        self.version = 0  # Bumped whenever the leaderboard would change
         self.load_members()
     
     def load_members(self):
@@ -106,6 +117,7 @@ class MemberDatabase:
             # Update existing member
             if score > self.members[full_email]['best_score']:
                 self.members[full_email]['best_score'] = score
+                self.version += 1
             self.members[full_email]['last_played'] = current_time
         else:
             # Add new member
@@ -116,6 +128,7 @@ class MemberDatabase:
                 'best_score': score,
                 'last_played': current_time
             }
+            self.version += 1
         
         self.save_to_csv()
         return full_name
@@ -154,18 +167,48 @@ class InputBox:
     
     def __init__(self, x, y, width, height, placeholder=""):
         self.rect = pygame.Rect(x, y, width, height)
-        self.color = gray
-        self.text = ''
+        self._text = ''
+        self._active = False
         self.placeholder = placeholder
-        self.active = False
-        self.font = pygame.font.SysFont('Courier New', 24)
+        self.font = get_font(24)
+        
+        # Long text runs past the right border, so the drawn area is widened to fit the longest allowed text
+        max_text_width = 10 + self.font.size('W' * 20)[0]
+        self.draw_rect = pygame.Rect(x, y, max(width, max_text_width), height)
+        
+        # Rendered box is cached and only re-rendered when marked dirty
+        self.surface = pygame.Surface(self.draw_rect.size)
+        self.dirty = True
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, value):
+        if value != self._text:
+            self._text = value
+            self.dirty = True
+    
+    @property
+    def active(self):
+        return self._active
+    
+    @active.setter
+    def active(self, value):
+        if value != self._active:
+            self._active = value
+            self.dirty = True
+    
+    @property
+    def color(self):
+        return blue if self.active else gray
     
     def handle_event(self, event):
         """Handle keyboard input and mouse clicks for the input box"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Toggle active state when clicked
             self.active = self.rect.collidepoint(event.pos)
-            self.color = blue if self.active else gray
         
         if event.type == pygame.KEYDOWN and self.active:
             if event.key == pygame.K_BACKSPACE:
@@ -174,20 +217,29 @@ class InputBox:
             elif len(self.text) < 20:  # Limit text length
                 self.text += event.unicode
     
-    def draw(self, screen):
-        """Draw the input box with game-style border"""
-        # Draw white background
-        pygame.draw.rect(screen, white, self.rect)
+    def render(self):
+        """Re-render the cached input box surface"""
+        local_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        
+        # Draw white background (also clears any old text past the border)
+        self.surface.fill(white)
         # Draw border (thicker when active)
         border_width = 3 if self.active else 2
-        pygame.draw.rect(screen, self.color, self.rect, border_width)
+        pygame.draw.rect(self.surface, self.color, local_rect, border_width)
         
         # Display text or placeholder
         display_text = self.text if self.text else self.placeholder
         text_color = black if self.text else gray
         
         text_surface = self.font.render(display_text, True, text_color)
-        screen.blit(text_surface, (self.rect.x + 10, self.rect.y + 12))
+        self.surface.blit(text_surface, (10, 12))
+        self.dirty = False
+    
+    def draw(self, screen):
+        """Draw the input box with game-style border"""
+        if self.dirty:
+            self.render()
+        screen.blit(self.surface, self.draw_rect)
 
 class Button:
     """Creates clickable buttons matching the game's visual style"""
@@ -196,28 +248,92 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
-        self.font = pygame.font.SysFont('Courier New', 24)
+        self.font = get_font(24)
         self.clicked = False
+        self.hovered = False
+        self.draw_rect = self.rect
+        
+        # Rendered button is cached and only re-rendered when marked dirty
+        self.surface = pygame.Surface(self.rect.size)
+        self.dirty = True
+    
+    def set_hovered(self, hovered):
+        """Update hover state, marking the button dirty if it changed"""
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.dirty = True
     
     def handle_event(self, event):
-        """Handle button click events"""
+        """Handle button click and hover events"""
+        if event.type == pygame.MOUSEMOTION:
+            self.set_hovered(self.rect.collidepoint(event.pos))
+        
+        # Clear hover when the mouse leaves the window
+        if event.type == pygame.WINDOWLEAVE:
+            self.set_hovered(False)
+        if event.type == pygame.ACTIVEEVENT and not event.gain and event.state & pygame.APPMOUSEFOCUS:
+            self.set_hovered(False)
+        
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.clicked = True
                 return True
         return False
     
-    def draw(self, screen):
-        """Draw the button with game-style appearance"""
+    def render(self):
+        """Re-render the cached button surface"""
+        local_rect = self.surface.get_rect()
+        
         # Draw button background
-        pygame.draw.rect(screen, self.color, self.rect)
-        # Draw border
-        pygame.draw.rect(screen, black, self.rect, 2)
+        self.surface.fill(self.color)
+        # Draw border (thicker when hovered)
+        border_width = 3 if self.hovered else 2
+        pygame.draw.rect(self.surface, black, local_rect, border_width)
         
         # Center the text on the button
         text_surface = self.font.render(self.text, True, white)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        self.surface.blit(text_surface, text_rect)
+        self.dirty = False
+    
+    def draw(self, screen):
+        """Draw the button with game-style appearance"""
+        if self.dirty:
+            self.render()
+        screen.blit(self.surface, self.rect)
+
+class ScreenLayer:
+    """Composes a cached background with retained widgets, redrawing only what changed"""
+    
+    def __init__(self, build_background, widgets):
+        self.build_background = build_background
+        self.widgets = widgets
+        self.background = None
+    
+    def invalidate(self):
+        """Throw away the cached background so it is rebuilt on the next draw"""
+        self.background = None
+    
+    def draw(self, screen, force=False):
+        """Draw onto the screen and return the list of rects that changed"""
+        if self.background is None:
+            self.background = self.build_background()
+            force = True
+        
+        if force:
+            screen.blit(self.background, (0, 0))
+            for widget in self.widgets:
+                widget.draw(screen)
+            return [screen.get_rect()]
+        
+        # Widgets are opaque, so dirty ones can be redrawn straight over the background
+        # (a widget's draw_rect must lie entirely over the static background and be fully painted, or it leaves trails)
+        changed_rects = []
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.draw(screen)
+                changed_rects.append(widget.draw_rect)
+        return changed_rects
 
 class SnakeGame:
     """Handles all snake game logic and rendering"""   
@@ -351,8 +467,16 @@ class ExpoGameSystem:
         self.snake_game = SnakeGame()
         self.running = True
         
+        # Track what is on the display so idle screens can skip redrawing
+        self.drawn_screen = None
+        self.window_exposed = False
+        
         # Create onboarding screen elements
         self.setup_onboarding_screen()
+        
+        # Leaderboard is cached and rebuilt only when the database scores change
+        self.leaderboard_layer = ScreenLayer(self.build_leaderboard_background, [])
+        self.leaderboard_version = None
     
     def setup_onboarding_screen(self):
         """Initialize all onboarding screen input elements"""
@@ -368,6 +492,17 @@ class ExpoGameSystem:
         self.register_button = Button(100, 420, 180, 60, "Play Game!", green)
         self.quick_login_button = Button(500, 330, 180, 60, "Quick Login", blue)
         self.leaderboard_button = Button(850, 250, 180, 60, "Leaderboard", gray)
+        
+        # Static text is baked into the layer background; widgets redraw themselves when dirty
+        self.onboarding_layer = ScreenLayer(self.build_onboarding_background, [
+            self.first_name_input,
+            self.last_name_input,
+            self.email_input,
+            self.quick_login_input,
+            self.register_button,
+            self.quick_login_button,
+            self.leaderboard_button
+        ])
     
     def handle_onboarding_events(self, event):
         """Handle all events on the onboarding screen"""
@@ -457,48 +592,39 @@ class ExpoGameSystem:
         self.current_player_name = ""
         self.current_player_email = ""
     
-    def draw_onboarding_screen(self):
-        """Draw the main onboarding screen with plain white background"""
+    def build_onboarding_background(self):
+        """Render the static parts of the onboarding screen onto a plain white background"""
+        background = pygame.Surface((window_width, window_height))
+        
         # Draw plain white background
-        game_window.fill(white)
+        background.fill(white)
         
         # Title section
-        title_font = pygame.font.SysFont('Courier New', 60, bold=True)
-        subtitle_font = pygame.font.SysFont('Courier New', 36)
+        title_font = get_font(60, bold=True)
+        subtitle_font = get_font(36)
         
         title_text = title_font.render("Southridge Coding Club", True, black)
         title_rect = title_text.get_rect(center=(window_width // 2, 80))
-        game_window.blit(title_text, title_rect)
+        background.blit(title_text, title_rect)
         
         subtitle_text = subtitle_font.render("Snake Game Challenge", True, blue)
         subtitle_rect = subtitle_text.get_rect(center=(window_width // 2, 130))
-        game_window.blit(subtitle_text, subtitle_rect)
+        background.blit(subtitle_text, subtitle_rect)
         
         # Section headers
-        section_font = pygame.font.SysFont('Courier New', 28, bold=True)
+        section_font = get_font(28, bold=True)
         
         new_member_text = section_font.render("New Member Registration:", True, black)
-        game_window.blit(new_member_text, (100, 170))
+        background.blit(new_member_text, (100, 170))
         
         returning_member_text = section_font.render("Returning Member:", True, black)
-        game_window.blit(returning_member_text, (500, 220))
+        background.blit(returning_member_text, (500, 220))
         
         leaderboard_text = section_font.render("View Scores:", True, black)
-        game_window.blit(leaderboard_text, (850, 220))
-        
-        # Draw all input elements
-        self.first_name_input.draw(game_window)
-        self.last_name_input.draw(game_window)
-        self.email_input.draw(game_window)
-        self.quick_login_input.draw(game_window)
-        
-        # Draw buttons
-        self.register_button.draw(game_window)
-        self.quick_login_button.draw(game_window)
-        self.leaderboard_button.draw(game_window)
+        background.blit(leaderboard_text, (850, 220))
         
         # Instructions section
-        instructions_font = pygame.font.SysFont('Courier New', 18)
+        instructions_font = get_font(18)
         instructions = [
             "Instructions:",
             "• New members: Fill out all fields and click 'Play Game!'",
@@ -510,8 +636,21 @@ class ExpoGameSystem:
         y_pos = 520
         for instruction in instructions:
             text = instructions_font.render(instruction, True, black)
-            game_window.blit(text, (100, y_pos))
+            background.blit(text, (100, y_pos))
             y_pos += 22
+        
+        return background
+    
+    def draw_onboarding_screen(self, force=False):
+        """Draw the onboarding screen and return the rects that changed"""
+        # Hover may be stale after coming back from another screen, so check the mouse again
+        if force:
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_in_window = pygame.mouse.get_focused()
+            for button in (self.register_button, self.quick_login_button, self.leaderboard_button):
+                button.set_hovered(mouse_in_window and button.rect.collidepoint(mouse_pos))
+        
+        return self.onboarding_layer.draw(game_window, force)
     
     def draw_game_screen(self):
         """Draw the game screen using last year's game's drawing method"""
@@ -571,29 +710,31 @@ class ExpoGameSystem:
             continue_text_rect = continue_surface.get_rect(center=continue_rect.center)
             game_window.blit(continue_surface, continue_text_rect)
     
-    def draw_leaderboard_screen(self):
-        """Draw the leaderboard screen with plain white background"""
+    def build_leaderboard_background(self):
+        """Render the full leaderboard screen with plain white background"""
+        background = pygame.Surface((window_width, window_height))
+        
         # Plain white background
-        game_window.fill(white)
+        background.fill(white)
         
         # Title
-        title_font = pygame.font.SysFont('Courier New', 60, bold=True)
+        title_font = get_font(60, bold=True)
         title_text = title_font.render("Leaderboard", True, black)
         title_rect = title_text.get_rect(center=(window_width // 2, 80))
-        game_window.blit(title_text, title_rect)
+        background.blit(title_text, title_rect)
         
         # Get top players
         leaderboard = self.database.get_leaderboard(10)
         
         if not leaderboard:
-            no_data_font = pygame.font.SysFont('Courier New', 36)
+            no_data_font = get_font(36)
             no_data_text = no_data_font.render("No players yet! Be the first to play!", True, gray)
             no_data_rect = no_data_text.get_rect(center=(window_width // 2, 250))
-            game_window.blit(no_data_text, no_data_rect)
+            background.blit(no_data_text, no_data_rect)
         else:
             # Draw leaderboard entries
             y_pos = 180
-            entry_font = pygame.font.SysFont('Courier New', 28)
+            entry_font = get_font(28)
             
             for i, (email, data) in enumerate(leaderboard):
                 """
@@ -619,14 +760,25 @@ class ExpoGameSystem:
                 
                 # Center the text
                 rank_rect = rank_surface.get_rect(center=(window_width // 2, y_pos))
-                game_window.blit(rank_surface, rank_rect)
+                background.blit(rank_surface, rank_rect)
                 y_pos += 40
         
         # Instructions
-        instruction_font = pygame.font.SysFont('Courier New', 24)
+        instruction_font = get_font(24)
         instruction_text = instruction_font.render("Press any key or click to return", True, gray)
         instruction_rect = instruction_text.get_rect(center=(window_width // 2, window_height - 50))
-        game_window.blit(instruction_text, instruction_rect)
+        background.blit(instruction_text, instruction_rect)
+        
+        return background
+    
+    def draw_leaderboard_screen(self, force=False):
+        """Draw the leaderboard screen and return the rects that changed"""
+        # Rebuild the cached leaderboard only when scores have changed
+        if self.leaderboard_version != self.database.version:
+            self.leaderboard_version = self.database.version
+            self.leaderboard_layer.invalidate()
+        
+        return self.leaderboard_layer.draw(game_window, force)
     
     def run(self):
         """Main game loop"""
@@ -636,6 +788,10 @@ class ExpoGameSystem:
                 if event.type == pygame.QUIT:
                     self.running = False
                 
+                # Window contents may have been lost, so repaint everything
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.window_exposed = True
+                
                 if self.current_screen == "onboarding":
                     self.handle_onboarding_events(event)
                 elif self.current_screen == "game":
@@ -647,16 +803,23 @@ class ExpoGameSystem:
             if self.current_screen == "game":
                 self.snake_game.update()
             
-            # Draw current screen
+            # Draw current screen (a full redraw is needed after switching screens)
+            force_redraw = self.current_screen != self.drawn_screen or self.window_exposed
+            changed_rects = []
             if self.current_screen == "onboarding":
-                self.draw_onboarding_screen()
+                changed_rects = self.draw_onboarding_screen(force_redraw)
             elif self.current_screen == "game":
                 self.draw_game_screen()
+                changed_rects = [game_window.get_rect()]
             elif self.current_screen == "leaderboard":
-                self.draw_leaderboard_screen()
+                changed_rects = self.draw_leaderboard_screen(force_redraw)
+            
+            self.drawn_screen = self.current_screen
+            self.window_exposed = False
             
-            # Update display and control frame rate
-            pygame.display.update()
+            # Update only the changed parts of the display and control frame rate
+            if changed_rects:
+                pygame.display.update(changed_rects)
             fps.tick(snake_speed)
         
         # Clean up